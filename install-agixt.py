@@ -134,15 +134,14 @@ def comprehensive_cleanup():
     
     base_paths = ['/var/apps', '/opt', '/home']
     for base_path in base_paths:
-        if os.path.exists(base_path):
-            try:
-                for item in os.listdir(base_path):
-                    if 'agixt' in item.lower():
-                        full_path = os.path.join(base_path, item)
-                        if os.path.isdir(full_path):
-                            directories_to_remove.append(full_path)
-            except:
-                pass
+        try:
+            # scandir carries the entry type, so no separate exists/isdir stats
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if 'agixt' in entry.name.lower() and entry.is_dir():
+                        directories_to_remove.append(entry.path)
+        except:
+            pass
     
     # Display what will be cleaned
     total_items = len(containers_to_remove) + len(images_to_remove) + len(directories_to_remove)
@@ -248,6 +247,7 @@ def main():
     github_token = None
     skip_cleanup = False
     skip_tests = False
+    generic_compose = False
     
     if len(sys.argv) > 1:
         for arg in sys.argv[1:]:
@@ -257,6 +257,9 @@ def main():
             elif arg == "--skip-tests" or arg == "--no-tests":
                 skip_tests = True
                 log("🚫 Post-installation tests disabled via command line flag")
+            elif arg == "--generic":
+                generic_compose = True
+                log("🐳 Generic docker-compose.yml requested via command line flag")
             elif arg.startswith("github_pat_") or arg.startswith("ghp_"):
                 github_token = arg
                 log("🔑 GitHub token provided")
@@ -273,6 +276,7 @@ def main():
         log("📝 Examples:", "ERROR")
         log("  python3 install-agixt.py agixt github_pat_11AAAA...", "ERROR")
         log("  python3 install-agixt.py agixt github_pat_11AAAA... --skip-tests", "ERROR")
+        log("  python3 install-agixt.py agixt github_pat_11AAAA... --generic", "ERROR")
         log("", "ERROR")
         log("🔑 Get your GitHub token at: https://github.com/settings/tokens", "ERROR")
         log("   Required permissions: repo (Full control of private repositories)", "ERROR")
@@ -281,6 +285,7 @@ def main():
     log("🔧 Configuration: " + config_name)
     log("🗑️  Skip cleanup: " + str(skip_cleanup))
     log("🧪 Skip tests: " + str(skip_tests))
+    log("🐳 Generic compose: " + str(generic_compose))
     
     log("🔍 CLEANUP PHASE STARTING...")
     
@@ -354,7 +359,7 @@ def main():
             
             # Run the main installer with GitHub token
             log("🚀 Starting v1.7.2 simplified installation...")
-            success = installer_core.run_installation(config_name, github_token, skip_cleanup)
+            success = installer_core.run_installation(config_name, github_token, skip_cleanup, generic_compose)
             
             if success:
                 log("🎉 AGiXT v1.7.2 installation completed successfully!", "SUCCESS")
@@ -369,15 +374,17 @@ def main():
                     # Try to find the installation path
                     base_paths = ['/var/apps']
                     for base_path in base_paths:
-                        if os.path.exists(base_path):
-                            for item in os.listdir(base_path):
-                                if 'agixt' in item.lower() and ('v1.7' in item or 'v1.6' in item):
-                                    candidate_path = os.path.join(base_path, item)
-                                    if os.path.isdir(candidate_path):
-                                        install_path = candidate_path
+                        try:
+                            with os.scandir(base_path) as entries:
+                                for entry in entries:
+                                    name = entry.name
+                                    if 'agixt' in name.lower() and ('v1.7' in name or 'v1.6' in name) and entry.is_dir():
+                                        install_path = entry.path
                                         break
-                            if install_path:
-                                break
+                        except FileNotFoundError:
+                            continue
+                        if install_path:
+                            break
                     
                     if not install_path:
                         # Fallback to common paths
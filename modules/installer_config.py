@@ -10,10 +10,21 @@ Updated to work with public repositories without authentication.
 import urllib.request
 import urllib.error
 import os
-from installer_utils import log
+from datetime import datetime
+from installer_utils import log, generate_secure_api_key
+
+# Parsed configs by (github_token, config_name); the installer asks for the same
+# config more than once per run and the file cannot change in between
+_loaded_configs = {}
 
 def load_config_from_github(github_token=None, config_name="proxy"):
     """Load configuration from GitHub config file - works with public repos"""
+    cached = _loaded_configs.get((github_token, config_name))
+    if cached:
+        log("♻️  Reusing configuration already loaded for: " + config_name + ".config")
+        # Callers enhance the dict in place, so each gets its own copy
+        return dict(cached)
+    
     config = {}
     
     log("📋 Loading configuration from public GitHub repository...")
@@ -54,7 +65,7 @@ def load_config_from_github(github_token=None, config_name="proxy"):
                     log("✅ Successfully downloaded config from: " + config_file, "SUCCESS")
                     
                     # Parse the config file
-                    for line_num, line in enumerate(content.split('\n'), 1):
+                    for line in content.splitlines():
                         line = line.strip()
                         
                         # Skip comments and empty lines
@@ -62,8 +73,8 @@ def load_config_from_github(github_token=None, config_name="proxy"):
                             continue
                             
                         # Parse KEY=VALUE pairs
-                        if '=' in line:
-                            key, value = line.split('=', 1)
+                        key, sep, value = line.partition('=')
+                        if sep:
                             key = key.strip()
                             value = value.strip()
                             
@@ -101,6 +112,7 @@ def load_config_from_github(github_token=None, config_name="proxy"):
                     log("🤖 Model: " + config.get('MODEL_NAME', 'Unknown'))
                     log("🏗️  Install path: " + config.get('INSTALL_BASE_PATH', 'Unknown'))
                     
+                    _loaded_configs[(github_token, config_name)] = dict(config)
                     return config
                     
             except urllib.error.HTTPError as e:
@@ -134,8 +146,8 @@ def load_config_fallback():
                     line = line.strip()
                     if not line or line.startswith('#'):
                         continue
-                    if '=' in line:
-                        key, value = line.split('=', 1)
+                    key, sep, value = line.partition('=')
+                    if sep:
                         config[key.strip()] = value.strip()
             
             if config:
@@ -169,7 +181,7 @@ def validate_config(config):
     
     missing_keys = []
     for key, description in required_keys.items():
-        if key not in config or not config[key]:
+        if not config.get(key):
             missing_keys.append(key + " (" + description + ")")
     
     if missing_keys:
@@ -198,11 +210,9 @@ def enhance_config_with_dynamic_values(config):
     log("🔧 Enhancing configuration with dynamic values...")
     
     # Add install timestamp
-    from datetime import datetime
     config['INSTALL_DATE'] = datetime.now().isoformat()
     
     # Generate API key placeholder (will be replaced during installation)
-    from installer_utils import generate_secure_api_key
     config['AGIXT_API_KEY'] = generate_secure_api_key()
     
     log("✅ Added INSTALL_DATE: " + config['INSTALL_DATE'])
@@ -13,11 +13,10 @@ Key Changes in v1.7.2:
 - Keep all environment variables and configurations intact
 """
 
-import sys
 import os
 from installer_utils import log
 
-def run_installation(config_name, github_token, skip_cleanup):
+def run_installation(config_name, github_token, skip_cleanup, generic_compose=False):
     """Enhanced installation function - v1.7.2 simplified approach"""
     
     log("🎯 AGiXT Enhanced Core Installer v1.7.2 - Starting Installation Process", "HEADER")
@@ -27,6 +26,7 @@ def run_installation(config_name, github_token, skip_cleanup):
     else:
         log("🔑 GitHub token: Not provided (using public repository)")
     log("🗑️  Cleanup skipped: " + str(skip_cleanup))
+    log("🐳 Generic compose file: " + str(generic_compose))
     log("🔧 v1.7.2: Simplified approach - no forced API testing during install")
     
     try:
@@ -111,7 +111,7 @@ def run_installation(config_name, github_token, skip_cleanup):
         # Run full installation if all modules available
         if all(modules_status.values()):
             log("🚀 All modules available - running simplified installation...", "SUCCESS")
-            return run_simplified_installation(config_name, github_token, skip_cleanup)
+            return run_simplified_installation(config_name, github_token, skip_cleanup, generic_compose)
         else:
             log("📋 PARTIAL INSTALLATION TEST SUCCESSFUL", "SUCCESS")
             log("✅ Core module is working correctly")
@@ -126,7 +126,7 @@ def run_installation(config_name, github_token, skip_cleanup):
         log(f"❌ Core installation error: {e}", "ERROR")
         return False
 
-def run_simplified_installation(config_name, github_token, skip_cleanup):
+def run_simplified_installation(config_name, github_token, skip_cleanup, generic_compose=False):
     """Run simplified installation - v1.7.2 approach"""
     
     log("🚀 SIMPLIFIED INSTALLATION MODE v1.7.2 - Reliable service startup", "HEADER")
@@ -213,7 +213,7 @@ def run_simplified_installation(config_name, github_token, skip_cleanup):
                         log("❌ Install path and config required for this step", "ERROR")
                         return False
                     log("🐳 Starting Docker configuration...", "INFO")
-                    if not installer_docker.create_configuration(install_path, config):
+                    if not installer_docker.create_configuration(install_path, config, generic_compose):
                         log("❌ Docker configuration failed", "ERROR")
                         return False
                     log("✅ Docker configuration completed")
@@ -252,36 +252,43 @@ def run_simplified_installation(config_name, github_token, skip_cleanup):
                     verify_installation(install_path, config)
         
         # Enhanced success reporting
-        final_model_name = config.get('FINAL_MODEL_NAME', config.get('MODEL_NAME', 'Unknown-Model'))
+        final_model_name = config.get('FINAL_MODEL_NAME') or config.get('MODEL_NAME') or 'Unknown-Model'
         version = config.get('AGIXT_VERSION', 'unknown')
         
         log("\n" + "=" * 80, "SUCCESS")
         log("🎉 AGiXT v1.7.2 Installation Complete!", "SUCCESS")
         log("=" * 80, "SUCCESS")
-        log(f"📁 Directory: {install_path}")
-        log(f"🔧 Version: {version}")
-        log(f"🤖 Model: {final_model_name}")
+        log("\n".join([
+            f"📁 Directory: {install_path}",
+            f"🔧 Version: {version}",
+            f"🤖 Model: {final_model_name}"
+        ]))
         
         # Access information
-        log("\n🌐 Access Information:", "INFO")
-        log("  📱 Frontend: http://localhost:3437")
-        log("  🔧 Backend API: http://localhost:7437") 
-        log("  🤖 EzLocalAI API: http://localhost:8091")
-        log("  🎮 EzLocalAI UI: http://localhost:8502")
+        access_lines = [
+            "\n🌐 Access Information:",
+            "  📱 Frontend: http://localhost:3437",
+            "  🔧 Backend API: http://localhost:7437",
+            "  🤖 EzLocalAI API: http://localhost:8091",
+            "  🎮 EzLocalAI UI: http://localhost:8502"
+        ]
         
         # Configuration URLs
         agixt_server = config.get('AGIXT_SERVER', '')
         app_uri = config.get('APP_URI', '')
         if agixt_server:
-            log(f"  🌍 Production Backend: {agixt_server}")
+            access_lines.append(f"  🌍 Production Backend: {agixt_server}")
         if app_uri:
-            log(f"  🌍 Production Frontend: {app_uri}")
+            access_lines.append(f"  🌍 Production Frontend: {app_uri}")
+        log("\n".join(access_lines), "INFO")
         
-        log("\n📋 v1.7.2 Notes:", "INFO")
-        log("  • No agents created during installation")
-        log("  • Create agents manually via frontend UI")
-        log("  • All services running independently")
-        log("  • Basic verification completed successfully")
+        log("\n".join([
+            "\n📋 v1.7.2 Notes:",
+            "  • No agents created during installation",
+            "  • Create agents manually via frontend UI",
+            "  • All services running independently",
+            "  • Basic verification completed successfully"
+        ]), "INFO")
         
         log("✅ Installation completed successfully!", "SUCCESS")
         
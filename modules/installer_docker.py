@@ -8,77 +8,259 @@ NO EzLocalAI service - clean, simple, reliable installation.
 """
 
 import os
+import re
+import json
+import stat
 import subprocess
 import time
-from installer_utils import log, run_command
+from types import MappingProxyType
+from installer_utils import log, log_batch, generate_secure_api_key
+
+try:
+    import yaml  # Optional - only used to sanity-check the compose template
+except ImportError:
+    yaml = None
+
+# docker compose argv, built once and reused for every call
+COMPOSE_DOWN = ("docker", "compose", "down", "--remove-orphans")
+COMPOSE_UP = ("docker", "compose", "up", "-d")
+COMPOSE_PS = ("docker", "compose", "ps")
+COMPOSE_PS_ALL_IDS = ("docker", "compose", "ps", "-a", "-q")
+# One line per container (exited ones included): compose service plus health
+# status, or plain state when no healthcheck.
+# Go templates need a recent Compose v2; older plugins only accept pretty/json.
+COMPOSE_PS_HEALTH = (
+    "docker", "compose", "ps", "-a", "--format",
+    "{{.Service}} {{if .Health}}{{.Health}}{{else}}{{.State}}{{end}}"
+)
+# Same output via docker inspect, which every Docker version supports
+CONTAINER_HEALTH = (
+    "docker", "inspect", "--format",
+    '{{index .Config.Labels "com.docker.compose.service"}} '
+    "{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}"
+)
+# Services in docker-compose.yml; all of them must be up before startup is done
+REQUIRED_SERVICES = ('agixt', 'agixtinteractive')
+READY_STATES = frozenset({'healthy', 'running'})
+
+# Host ports always written to .env; these override any value from the user
+# config because docker-compose.yml and the access URLs assume them.
+FORCED_PORTS = MappingProxyType({
+    'AGIXT_PORT': '7437',
+    'AGIXT_INTERACTIVE_PORT': '3437'
+})
+
+# Defaults are read-only so no caller can mutate the shared tables
+# === AGIXT BACKEND VARIABLES ===
+AGIXT_DEFAULTS = MappingProxyType({
+    'DATABASE_TYPE': 'sqlite',
+    'DATABASE_NAME': 'models/agixt',
+    'UVICORN_WORKERS': '10',
+    'AGIXT_URI': 'http://agixt:7437',
+    'WORKING_DIRECTORY': '/agixt/WORKSPACE',
+    'REGISTRATION_DISABLED': 'false',
+    'TOKENIZERS_PARALLELISM': 'false',
+    'LOG_LEVEL': 'INFO',
+    'STORAGE_BACKEND': 'local',
+    'STORAGE_CONTAINER': 'agixt-workspace',
+    'SEED_DATA': 'true',
+    'AGIXT_AGENT': 'XT',
+    'GRAPHIQL': 'true',
+    'TZ': 'America/New_York',
+    'ROTATION_EXCLUSIONS': '',
+    'DISABLED_EXTENSIONS': '',
+    'DISABLED_PROVIDERS': ''
+})
+
+# === FRONTEND VARIABLES (RESPECT USER CONFIG) ===
+FRONTEND_DEFAULTS = MappingProxyType({
+    'MODE': 'production',
+    'NEXT_TELEMETRY_DISABLED': '1',
+    'AGIXT_FOOTER_MESSAGE': 'AGiXT 2025',
+    'APP_DESCRIPTION': 'AGiXT is an advanced artificial intelligence agent orchestration agent.',
+    'APP_NAME': 'AGiXT',
+    'LOG_VERBOSITY_SERVER': '3',
+    'AGIXT_FILE_UPLOAD_ENABLED': 'true',
+    'AGIXT_VOICE_INPUT_ENABLED': 'true',
+    'AGIXT_RLHF': 'true',
+    'AGIXT_ALLOW_MESSAGE_EDITING': 'true',
+    'AGIXT_ALLOW_MESSAGE_DELETION': 'true',
+    'AGIXT_SHOW_OVERRIDE_SWITCHES': 'tts,websearch,analyze-user-input',
+    'AGIXT_CONVERSATION_MODE': 'select',
+    'INTERACTIVE_MODE': 'chat',
+    'ALLOW_EMAIL_SIGN_IN': 'true'
+    # NOTE: AGIXT_SERVER and APP_URI MUST come from user config
+})
+
+# Installer switches that may appear in the config but are not container settings
+INSTALLER_ONLY_KEYS = frozenset({'COMPOSE_GENERIC'})
+
+# Comment block written at the top of .env
+ENV_HEADER = (
+    "# AGiXT v1.7.2 Environment Configuration (NO EzLocalAI)\n"
+    "# Clean installation - Backend and Frontend only\n\n"
+)
+
+# Environment passed to each container, by name; (container name, .env name)
+# pairs rename a variable. Placeholder defaults come from COMPOSE_DEFAULTS, so
+# default values live only in the tables above.
+AGIXT_SERVICE_ENV = (
+    'DATABASE_TYPE', 'DATABASE_NAME', 'UVICORN_WORKERS', 'AGIXT_API_KEY',
+    'AGIXT_URI', 'APP_URI', 'WORKING_DIRECTORY', 'REGISTRATION_DISABLED',
+    'TOKENIZERS_PARALLELISM', 'LOG_LEVEL', 'STORAGE_BACKEND', 'STORAGE_CONTAINER',
+    'SEED_DATA', ('AGENT_NAME', 'AGIXT_AGENT'), 'GRAPHIQL', 'TZ'
+)
+FRONTEND_SERVICE_ENV = (
+    'MODE', 'NEXT_TELEMETRY_DISABLED', 'AGIXT_AGENT', 'AGIXT_FOOTER_MESSAGE',
+    'AGIXT_SERVER', 'APP_DESCRIPTION', 'APP_NAME', 'APP_URI', 'LOG_VERBOSITY_SERVER',
+    'AGIXT_FILE_UPLOAD_ENABLED', 'AGIXT_VOICE_INPUT_ENABLED', 'AGIXT_RLHF',
+    'AGIXT_ALLOW_MESSAGE_EDITING', 'AGIXT_ALLOW_MESSAGE_DELETION',
+    'AGIXT_SHOW_OVERRIDE_SWITCHES', 'AGIXT_CONVERSATION_MODE', 'INTERACTIVE_MODE',
+    'ALLOW_EMAIL_SIGN_IN', 'TZ'
+)
+COMPOSE_DEFAULTS = MappingProxyType({
+    **AGIXT_DEFAULTS,
+    **FRONTEND_DEFAULTS,
+    'AGIXT_API_KEY': 'None',
+    'AGIXT_SERVER': 'https://agixt.locod-ai.com',
+    'APP_URI': 'https://agixtui.locod-ai.com'
+})
+
+def compose_environment(entries):
+    """Render environment: lines as ${VAR:-default} placeholders"""
+    lines = []
+    for entry in entries:
+        name, source = entry if isinstance(entry, tuple) else (entry, entry)
+        default = COMPOSE_DEFAULTS.get(source, '')
+        placeholder = f"${{{source}:-{default}}}" if default else f"${{{source}}}"
+        lines.append(f"      {name}: {placeholder}")
+    return "\n".join(lines)
+
+# docker-compose.yml for AGiXT backend and frontend (NO EzLocalAI service)
+DOCKER_COMPOSE_LAYOUT = """networks:
+  agixt-network:
+    external: true
+
+services:
+  agixt:
+    image: joshxt/agixt:main
+    init: true
+    restart: unless-stopped
+    environment:
+{agixt_environment}
+    ports:
+      - "${{AGIXT_PORT:-7437}}:7437"
+    volumes:
+      - ./models:/agixt/models
+      - ./WORKSPACE:/agixt/WORKSPACE
+      - ./conversations:/agixt/conversations
+      - /var/run/docker.sock:/var/run/docker.sock
+    healthcheck:
+      test: ["CMD", "python3", "-c", "import socket; socket.create_connection(('localhost', 7437), 3)"]
+      interval: 5s
+      timeout: 5s
+      retries: 30
+    networks:
+      - agixt-network
+
+  agixtinteractive:
+    image: joshxt/agixt-interactive:main
+    init: true
+    environment:
+{frontend_environment}
+    ports:
+      - "${{AGIXT_INTERACTIVE_PORT:-3437}}:3437"
+    restart: unless-stopped
+    volumes:
+      - ./node_modules:/app/node_modules
+    healthcheck:
+      test: ["CMD", "node", "-e", "require('net').connect(3437, 'localhost').on('connect', () => process.exit(0)).on('error', () => process.exit(1))"]
+      interval: 5s
+      timeout: 5s
+      retries: 30
+    networks:
+      - agixt-network
+"""
+
+DOCKER_COMPOSE_TEMPLATE = DOCKER_COMPOSE_LAYOUT.format(
+    agixt_environment=compose_environment(AGIXT_SERVICE_ENV),
+    frontend_environment=compose_environment(FRONTEND_SERVICE_ENV)
+)
+
+# Fail at import (not after docker has started) if the template is not valid YAML
+if __debug__ and yaml is not None:
+    yaml.load(DOCKER_COMPOSE_TEMPLATE, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+# Compose interpolation placeholders: ${VAR} and ${VAR:-default}
+COMPOSE_PLACEHOLDER = re.compile(r'\$\{(\w+)(?::-([^}]*))?\}')
+# environment: entries whose whole value is a single placeholder
+COMPOSE_ENV_ENTRY = re.compile(r'^(\s+\w+: )\$\{(\w+)(?::-([^}]*))?\}$', re.MULTILINE)
+# Secrets stay as placeholders so they are only ever stored in .env
+COMPOSE_RUNTIME_VARS = frozenset({'AGIXT_API_KEY'})
+
+def render_compose_literal(template, all_vars):
+    """Resolve compose placeholders against all_vars, leaving only secrets for .env"""
+    
+    def resolve(name, default):
+        # Same rule as compose ':-': empty or missing falls back to the default
+        value = all_vars.get(name) or default or ''
+        return str(value).replace('$', '$$')
+    
+    def resolve_entry(match):
+        if match.group(2) in COMPOSE_RUNTIME_VARS:
+            return match.group(0)
+        # Quoted YAML string keeps 'true', '1', etc. as strings
+        return match.group(1) + json.dumps(resolve(match.group(2), match.group(3)))
+    
+    def resolve_inline(match):
+        if match.group(1) in COMPOSE_RUNTIME_VARS:
+            return match.group(0)
+        return resolve(match.group(1), match.group(2))
+    
+    content = COMPOSE_ENV_ENTRY.sub(resolve_entry, template)
+    # Remaining placeholders sit inside already quoted values (ports)
+    return COMPOSE_PLACEHOLDER.sub(resolve_inline, content)
+
+def write_file(path, content):
+    """Atomically write text to path through a raw fd; returns the size in bytes"""
+    data = content.encode('utf-8')
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            remaining = memoryview(data)
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+        finally:
+            os.close(fd)
+        # Readers see either the old file or the complete new one, never a torn write
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return len(data)
 
 def generate_all_variables(config):
     """Generate variables for AGiXT Backend and Frontend only (NO EzLocalAI)"""
     
     log("🔧 Generating variables for AGiXT Backend and Frontend (NO EzLocalAI)...")
     
-    # Start with customer config as base
-    all_vars = config.copy()
+    # Customer config wins over defaults (later entries take precedence); the
+    # merge also fixes .env order: backend, frontend, then config-only keys
+    all_vars = {**AGIXT_DEFAULTS, **FRONTEND_DEFAULTS, **config}
+    
+    # Installer switches never reach .env
+    for key in INSTALLER_ONLY_KEYS:
+        all_vars.pop(key, None)
     
     # Generate security keys
-    from installer_utils import generate_secure_api_key
     if 'AGIXT_API_KEY' not in all_vars:
         all_vars['AGIXT_API_KEY'] = generate_secure_api_key()
         log("✅ Generated AGIXT_API_KEY")
     
-    # === AGIXT BACKEND VARIABLES ===
-    agixt_defaults = {
-        'DATABASE_TYPE': 'sqlite',
-        'DATABASE_NAME': 'models/agixt',
-        'UVICORN_WORKERS': '10',
-        'AGIXT_URI': 'http://agixt:7437',
-        'WORKING_DIRECTORY': '/agixt/WORKSPACE',
-        'REGISTRATION_DISABLED': 'false',
-        'TOKENIZERS_PARALLELISM': 'false',
-        'LOG_LEVEL': 'INFO',
-        'STORAGE_BACKEND': 'local',
-        'STORAGE_CONTAINER': 'agixt-workspace',
-        'SEED_DATA': 'true',
-        'AGIXT_AGENT': 'XT',
-        'GRAPHIQL': 'true',
-        'TZ': 'America/New_York',
-        'ROTATION_EXCLUSIONS': '',
-        'DISABLED_EXTENSIONS': '',
-        'DISABLED_PROVIDERS': ''
-    }
-    
-    # === FRONTEND VARIABLES (RESPECT USER CONFIG) ===
-    frontend_defaults = {
-        'MODE': 'production',
-        'NEXT_TELEMETRY_DISABLED': '1',
-        'AGIXT_FOOTER_MESSAGE': 'AGiXT 2025',
-        'APP_DESCRIPTION': 'AGiXT is an advanced artificial intelligence agent orchestration agent.',
-        'APP_NAME': 'AGiXT',
-        'LOG_VERBOSITY_SERVER': '3',
-        'AGIXT_FILE_UPLOAD_ENABLED': 'true',
-        'AGIXT_VOICE_INPUT_ENABLED': 'true',
-        'AGIXT_RLHF': 'true',
-        'AGIXT_ALLOW_MESSAGE_EDITING': 'true',
-        'AGIXT_ALLOW_MESSAGE_DELETION': 'true',
-        'AGIXT_SHOW_OVERRIDE_SWITCHES': 'tts,websearch,analyze-user-input',
-        'AGIXT_CONVERSATION_MODE': 'select',
-        'INTERACTIVE_MODE': 'chat',
-        'ALLOW_EMAIL_SIGN_IN': 'true'
-        # NOTE: AGIXT_SERVER and APP_URI MUST come from user config
-    }
-    
-    # Apply defaults (ONLY if not already in config)
-    for key, default_value in agixt_defaults.items():
-        if key not in all_vars:
-            all_vars[key] = default_value
-    
-    for key, default_value in frontend_defaults.items():
-        if key not in all_vars:
-            all_vars[key] = default_value
-    
-    # Set ports
-    all_vars['AGIXT_PORT'] = '7437'
-    all_vars['AGIXT_INTERACTIVE_PORT'] = '3437'
+    # Set ports (explicit override of user config)
+    all_vars.update(FORCED_PORTS)
     
     # CRITICAL: Ensure production URLs from config are preserved
     log("🔍 Checking URL configuration...")
@@ -97,14 +279,28 @@ def generate_all_variables(config):
     
     return all_vars
 
-def create_configuration(install_path, config):
-    """Create .env and docker-compose.yml WITHOUT EzLocalAI"""
+def create_configuration(install_path, config, generic_compose=False):
+    """Create .env and docker-compose.yml WITHOUT EzLocalAI
+    
+    generic_compose keeps ${VAR:-default} placeholders in docker-compose.yml
+    (also enabled by COMPOSE_GENERIC=true in the config file).
+    """
+    
+    # Every output path is resolved once up front
+    join = os.path.join
+    env_path = join(install_path, ".env")
+    docker_compose_path = join(install_path, "docker-compose.yml")
     
     try:
         log("🐳 Creating Docker configuration (NO EzLocalAI)...")
         
         # Generate variables for AGiXT services only
-        all_vars = generate_all_variables(config)
+        with log_batch():
+            all_vars = generate_all_variables(config)
+        
+        # Insertion order (backend defaults, frontend defaults, then config-only keys
+        # as written in the config file) is already deterministic - no sort needed
+        env_lines = [f"{key}={value}\n" for key, value in all_vars.items()]
         
         # Create simplified directory structure (no EzLocalAI dirs)
         log("📁 Creating directory structure...")
@@ -115,116 +311,50 @@ def create_configuration(install_path, config):
             "conversations"    # Conversations directory
         ]
         
-        for directory in directories:
-            dir_path = os.path.join(install_path, directory)
-            try:
-                os.makedirs(dir_path, exist_ok=True)
-                os.chmod(dir_path, 0o755)
-                log(f"✅ Created: {directory}")
-            except Exception as e:
-                log(f"❌ Failed to create {directory}: {e}", "ERROR")
-                return False
+        dir_paths = [join(install_path, directory) for directory in directories]
+        
+        # mode= replaces a separate chmod; the umask is pinned so 0o755 sticks
+        old_umask = os.umask(0o022)
+        try:
+            for dir_path in dir_paths:
+                os.makedirs(dir_path, mode=0o755, exist_ok=True)
+                # Directories left by a previous install keep their mode; fix only if wrong
+                if stat.S_IMODE(os.stat(dir_path).st_mode) != 0o755:
+                    os.chmod(dir_path, 0o755)
+        except OSError as e:
+            log(f"❌ Failed to create {e.filename}: {e}", "ERROR")
+            return False
+        finally:
+            os.umask(old_umask)
+        
+        log("📁 Directories ready: " + ", ".join(directories))
         
         # Create .env file
-        env_path = os.path.join(install_path, ".env")
         log("📄 Creating .env file (NO EzLocalAI variables)...")
         
-        with open(env_path, 'w') as f:
-            f.write("# AGiXT v1.7.2 Environment Configuration (NO EzLocalAI)\n")
-            f.write("# Clean installation - Backend and Frontend only\n\n")
-            
-            for key, value in sorted(all_vars.items()):
-                f.write(f"{key}={value}\n")
+        env_content = ENV_HEADER + "".join(env_lines)
+        env_size = write_file(env_path, env_content)
         
-        log(f"✅ .env file created with {len(all_vars)} variables")
+        log(f"✅ .env file created with {len(env_lines)} variables")
         
         # Create docker-compose.yml WITHOUT EzLocalAI service
         log("🐳 Creating docker-compose.yml (NO EzLocalAI service)...")
         
-        docker_compose_content = """networks:
-  agixt-network:
-    external: true
-
-services:
-  agixt:
-    image: joshxt/agixt:main
-    init: true
-    restart: unless-stopped
-    environment:
-      DATABASE_TYPE: ${DATABASE_TYPE:-sqlite}
-      DATABASE_NAME: ${DATABASE_NAME:-models/agixt}
-      UVICORN_WORKERS: ${UVICORN_WORKERS:-10}
-      AGIXT_API_KEY: ${AGIXT_API_KEY:-None}
-      AGIXT_URI: ${AGIXT_URI:-http://agixt:7437}
-      APP_URI: ${APP_URI}
-      WORKING_DIRECTORY: ${WORKING_DIRECTORY:-/agixt/WORKSPACE}
-      REGISTRATION_DISABLED: ${REGISTRATION_DISABLED:-false}
-      TOKENIZERS_PARALLELISM: "false"
-      LOG_LEVEL: ${LOG_LEVEL:-INFO}
-      STORAGE_BACKEND: ${STORAGE_BACKEND:-local}
-      STORAGE_CONTAINER: ${STORAGE_CONTAINER:-agixt-workspace}
-      SEED_DATA: ${SEED_DATA:-true}
-      AGENT_NAME: ${AGIXT_AGENT:-XT}
-      GRAPHIQL: ${GRAPHIQL:-true}
-      TZ: ${TZ:-America/New_York}
-    ports:
-      - "${AGIXT_PORT:-7437}:7437"
-    volumes:
-      - ./models:/agixt/models
-      - ./WORKSPACE:/agixt/WORKSPACE
-      - ./conversations:/agixt/conversations
-      - /var/run/docker.sock:/var/run/docker.sock
-    networks:
-      - agixt-network
-
-  agixtinteractive:
-    image: joshxt/agixt-interactive:main
-    init: true
-    environment:
-      MODE: ${MODE}
-      NEXT_TELEMETRY_DISABLED: ${NEXT_TELEMETRY_DISABLED}
-      AGIXT_AGENT: ${AGIXT_AGENT:-XT}
-      AGIXT_FOOTER_MESSAGE: ${AGIXT_FOOTER_MESSAGE:-AGiXT 2025}
-      AGIXT_SERVER: ${AGIXT_SERVER:-https://agixt.locod-ai.com}
-      APP_DESCRIPTION: ${APP_DESCRIPTION:-AGiXT is an advanced artificial intelligence agent orchestration agent.}
-      APP_NAME: ${APP_NAME:-AGiXT}
-      APP_URI: ${APP_URI:-https://agixtui.locod-ai.com}
-      LOG_VERBOSITY_SERVER: ${LOG_VERBOSITY_SERVER:-3}
-      AGIXT_FILE_UPLOAD_ENABLED: ${AGIXT_FILE_UPLOAD_ENABLED:-true}
-      AGIXT_VOICE_INPUT_ENABLED: ${AGIXT_VOICE_INPUT_ENABLED:-true}
-      AGIXT_RLHF: ${AGIXT_RLHF:-true}
-      AGIXT_ALLOW_MESSAGE_EDITING: ${AGIXT_ALLOW_MESSAGE_EDITING:-true}
-      AGIXT_ALLOW_MESSAGE_DELETION: ${AGIXT_ALLOW_MESSAGE_DELETION:-true}
-      AGIXT_SHOW_OVERRIDE_SWITCHES: ${AGIXT_SHOW_OVERRIDE_SWITCHES:-tts,websearch,analyze-user-input}
-      AGIXT_CONVERSATION_MODE: ${AGIXT_CONVERSATION_MODE:-select}
-      INTERACTIVE_MODE: ${INTERACTIVE_MODE:-chat}
-      ALLOW_EMAIL_SIGN_IN: ${ALLOW_EMAIL_SIGN_IN:-true}
-      TZ: ${TZ:-America/New_York}
-    ports:
-      - "${AGIXT_INTERACTIVE_PORT:-3437}:3437"
-    restart: unless-stopped
-    volumes:
-      - ./node_modules:/app/node_modules
-    networks:
-      - agixt-network
-"""
+        docker_compose_content = DOCKER_COMPOSE_TEMPLATE
+        
+        # Bake resolved values into the file unless the generic template is requested
+        if generic_compose or config.get('COMPOSE_GENERIC', 'false').lower() == 'true':
+            log("ℹ️  Generic compose file - values will be read from .env by docker compose")
+        else:
+            docker_compose_content = render_compose_literal(docker_compose_content, all_vars)
         
-        docker_compose_path = os.path.join(install_path, "docker-compose.yml")
-        with open(docker_compose_path, 'w') as f:
-            f.write(docker_compose_content)
+        compose_size = write_file(docker_compose_path, docker_compose_content)
         
         log("✅ docker-compose.yml created (NO EzLocalAI)")
         
-        # Verify files
-        required_files = [".env", "docker-compose.yml"]
-        for file in required_files:
-            file_path = os.path.join(install_path, file)
-            if os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                log(f"✅ {file} created ({file_size} bytes)", "SUCCESS")
-            else:
-                log(f"❌ {file} creation failed", "ERROR")
-                return False
+        # write_file only returns once the file has been renamed into place
+        log(f"✅ .env created ({env_size} bytes)", "SUCCESS")
+        log(f"✅ docker-compose.yml created ({compose_size} bytes)", "SUCCESS")
         
         log("🔧 Docker configuration completed (NO EzLocalAI)", "SUCCESS")
         return True
@@ -240,27 +370,40 @@ def start_services_simplified(install_path, config):
         log("🚀 Starting AGiXT services (NO EzLocalAI)...")
         
         # Verify prerequisites
-        docker_compose_path = os.path.join(install_path, "docker-compose.yml")
-        env_path = os.path.join(install_path, ".env")
-        
-        for required_file in [docker_compose_path, env_path]:
-            if not os.path.exists(required_file):
-                log(f"❌ Required file not found: {required_file}", "ERROR")
-                return False
+        required_files = ["docker-compose.yml", ".env"]
+        present = {entry.name for entry in os.scandir(install_path)}
+        missing = [f for f in required_files if f not in present]
+        if missing:
+            log(f"❌ Required files not found in {install_path}: {missing}", "ERROR")
+            return False
         
         log("✅ Configuration files verified")
         
-        # Stop any existing services
+        # Stop any existing services (skipped on cold installs with no containers)
         log("🛑 Stopping any existing services...")
         try:
-            subprocess.run(
-                ["docker", "compose", "down"],
+            existing = subprocess.run(
+                COMPOSE_PS_ALL_IDS,
                 cwd=install_path,
                 capture_output=True,
-                text=True,
-                timeout=60
+                timeout=15
             )
-            log("✅ Existing services stopped")
+            if existing.returncode == 0 and not existing.stdout.strip():
+                log("✅ No existing services to stop")
+            else:
+                # Only stderr is worth keeping; progress output is discarded
+                down = subprocess.run(
+                    COMPOSE_DOWN,
+                    cwd=install_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=60
+                )
+                if down.returncode == 0:
+                    log("✅ Existing services stopped")
+                else:
+                    error = down.stderr.decode('utf-8', errors='replace').strip()
+                    log(f"⚠️  Could not stop existing services: {error}", "WARN")
         except Exception as e:
             log(f"⚠️  Could not stop existing services: {e}", "WARN")
         
@@ -268,41 +411,44 @@ def start_services_simplified(install_path, config):
         log("🚀 Starting AGiXT backend and frontend...")
         try:
             result = subprocess.run(
-                ["docker", "compose", "up", "-d"],
+                COMPOSE_UP,
                 cwd=install_path,
                 capture_output=True,
-                text=True,
                 timeout=300
             )
             
+            # Output is captured as bytes and only decoded when it is shown
             if result.returncode == 0:
                 log("✅ AGiXT services started successfully")
                 if result.stdout:
-                    stdout_lines = result.stdout.strip().split('\n')[:3]
-                    for line in stdout_lines:
-                        if line.strip():
-                            log(f"   {line}")
+                    stdout_lines = result.stdout.decode('utf-8', errors='replace').strip().split('\n')[:3]
+                    kept = [line for line in stdout_lines if line.strip()]
+                    if kept:
+                        log("\n".join(f"   {line}" for line in kept))
             else:
                 log(f"❌ Service startup failed with return code {result.returncode}", "ERROR")
                 if result.stderr:
-                    for line in result.stderr.split('\n')[:3]:
-                        if line.strip():
-                            log(f"Error: {line}", "ERROR")
+                    stderr_lines = result.stderr.decode('utf-8', errors='replace').split('\n')[:3]
+                    kept = [line for line in stderr_lines if line.strip()]
+                    if kept:
+                        log("\n".join(f"Error: {line}" for line in kept), "ERROR")
                 return False
                 
         except Exception as e:
             log(f"❌ Exception starting services: {e}", "ERROR")
             return False
         
-        # Simple wait
-        log("⏳ Allowing services to initialize (30 seconds)...")
-        time.sleep(30)
+        # Wait for container healthchecks instead of a fixed sleep
+        log("⏳ Waiting for services to report healthy (up to 120 seconds)...")
+        started = time.monotonic()
+        if wait_for_services_ready(install_path):
+            log(f"✅ Services ready after {time.monotonic() - started:.0f} seconds")
         
         # Check container status
         log("📊 Checking container status...")
         try:
             result = subprocess.run(
-                ["docker", "compose", "ps"],
+                COMPOSE_PS,
                 cwd=install_path,
                 capture_output=True,
                 text=True,
@@ -310,14 +456,12 @@ def start_services_simplified(install_path, config):
             )
             
             if result.returncode == 0:
-                log("📊 Container Status:")
-                status_lines = result.stdout.split('\n')[1:]
-                running_count = 0
-                for line in status_lines:
-                    if line.strip():
-                        log(f"   {line}")
-                        if 'running' in line.lower() or 'up' in line.lower():
-                            running_count += 1
+                status_lines = [line for line in result.stdout.split('\n')[1:] if line.strip()]
+                log("📊 Container Status:" + "".join(f"\n   {line}" for line in status_lines))
+                running_count = sum(
+                    1 for line in status_lines
+                    if 'running' in line.lower() or 'up' in line.lower()
+                )
                 
                 if running_count >= 2:
                     log(f"✅ {running_count} AGiXT containers running", "SUCCESS")
@@ -335,18 +479,105 @@ def start_services_simplified(install_path, config):
         log(f"❌ Error starting AGiXT services: {e}", "ERROR")
         return False
 
+def parse_container_states(output):
+    """Turn 'service state' lines into a {service: state} dict"""
+    return dict(
+        line.split(' ', 1)
+        for line in output.splitlines() if ' ' in line
+    )
+
+def inspect_container_states(install_path):
+    """Read container health with compose ps -a -q + docker inspect (two calls)"""
+    ps_result = subprocess.run(
+        COMPOSE_PS_ALL_IDS,
+        cwd=install_path,
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    if ps_result.returncode != 0:
+        raise RuntimeError(ps_result.stderr.strip() or f"docker compose ps exited {ps_result.returncode}")
+    
+    container_ids = ps_result.stdout.split()
+    if not container_ids:
+        return {}
+    
+    inspect_result = subprocess.run(
+        CONTAINER_HEALTH + tuple(container_ids),
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    if inspect_result.returncode != 0:
+        raise RuntimeError(inspect_result.stderr.strip() or f"docker inspect exited {inspect_result.returncode}")
+    return parse_container_states(inspect_result.stdout)
+
+def wait_for_services_ready(install_path, timeout=120, max_interval=10):
+    """Poll container health with backoff until every service is ready or the timeout expires"""
+    
+    deadline = time.monotonic() + timeout
+    delay = 1.0
+    states = {}
+    last_error = None
+    # Try the single-call compose template first; drop to inspect if unsupported
+    use_ps_format = True
+    
+    while time.monotonic() < deadline:
+        try:
+            if use_ps_format:
+                ps_result = subprocess.run(
+                    COMPOSE_PS_HEALTH,
+                    cwd=install_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                if ps_result.returncode == 0:
+                    states = parse_container_states(ps_result.stdout)
+                else:
+                    use_ps_format = False
+                    log(f"ℹ️  docker compose ps --format unavailable ({ps_result.stderr.strip()}); using docker inspect")
+            if not use_ps_format:
+                states = inspect_container_states(install_path)
+            last_error = None
+            # Exited containers are listed too, so a crashed service keeps us waiting
+            if all(states.get(service) in READY_STATES for service in REQUIRED_SERVICES):
+                return True
+        except Exception as e:
+            if str(e) != last_error:
+                log(f"⚠️  Could not read container health: {e}", "WARN")
+            last_error = str(e)
+        
+        # Poll quickly while containers boot, then back off; never sleep past the deadline
+        time.sleep(max(0, min(delay, deadline - time.monotonic())))
+        delay = min(delay * 1.6, max_interval)
+    
+    if last_error:
+        log(f"⚠️  Services not confirmed ready after {timeout}s: {last_error}", "WARN")
+        return False
+    
+    pending = [
+        f"{service} ({states.get(service, 'missing')})"
+        for service in REQUIRED_SERVICES if states.get(service) not in READY_STATES
+    ]
+    log(f"⚠️  Services not ready after {timeout}s: {', '.join(pending)}", "WARN")
+    return False
+
 # Compatibility functions
 def start_services(install_path, config):
     return start_services_simplified(install_path, config)
 
 def test_module():
     """Test this module"""
-    log("🧪 Testing installer_docker module (NO EzLocalAI)...")
+    # Progress chatter is stripped under python -O; results are always logged
+    if __debug__:
+        log("🧪 Testing installer_docker module (NO EzLocalAI)...")
     
     functions_to_test = [
         generate_all_variables,
         create_configuration,
         start_services_simplified,
+        wait_for_services_ready,
         start_services
     ]
     
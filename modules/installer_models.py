@@ -11,55 +11,65 @@ ADDED: Simple repo path mapping and configuration
 """
 
 import os
+from types import MappingProxyType
 from installer_utils import log
 
+# Common model names -> working HuggingFace GGUF repositories (read-only, built once)
+MODEL_REPO_MAPPING = MappingProxyType({
+    # TinyLlama models
+    'tinyllama': 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF',
+    'tinyllama-1.1b': 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF',
+    
+    # Phi models  
+    'phi-2': 'TheBloke/phi-2-dpo-GGUF',
+    'phi2': 'TheBloke/phi-2-dpo-GGUF',
+    
+    # DeepSeek models
+    'deepseek': 'TheBloke/deepseek-coder-1.3b-instruct-GGUF',
+    'deepseek-coder': 'TheBloke/deepseek-coder-1.3b-instruct-GGUF',
+    
+    # Llama models
+    'llama-2-7b': 'TheBloke/Llama-2-7B-Chat-GGUF',
+    'llama2': 'TheBloke/Llama-2-7B-Chat-GGUF',
+    
+    # Mistral models
+    'mistral-7b': 'TheBloke/Mistral-7B-Instruct-v0.1-GGUF',
+    'mistral': 'TheBloke/Mistral-7B-Instruct-v0.1-GGUF',
+    
+    # CodeLlama models
+    'codellama': 'TheBloke/CodeLlama-7B-Instruct-GGUF',
+    'code-llama': 'TheBloke/CodeLlama-7B-Instruct-GGUF',
+})
+
+DEFAULT_MODEL_REPO = 'TheBloke/phi-2-dpo-GGUF'
+
 def get_model_repo_mapping():
     """Map common model names to working HuggingFace GGUF repositories"""
-    return {
-        # TinyLlama models
-        'tinyllama': 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF',
-        'tinyllama-1.1b': 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF',
-        
-        # Phi models  
-        'phi-2': 'TheBloke/phi-2-dpo-GGUF',
-        'phi2': 'TheBloke/phi-2-dpo-GGUF',
-        
-        # DeepSeek models
-        'deepseek': 'TheBloke/deepseek-coder-1.3b-instruct-GGUF',
-        'deepseek-coder': 'TheBloke/deepseek-coder-1.3b-instruct-GGUF',
-        
-        # Llama models
-        'llama-2-7b': 'TheBloke/Llama-2-7B-Chat-GGUF',
-        'llama2': 'TheBloke/Llama-2-7B-Chat-GGUF',
-        
-        # Mistral models
-        'mistral-7b': 'TheBloke/Mistral-7B-Instruct-v0.1-GGUF',
-        'mistral': 'TheBloke/Mistral-7B-Instruct-v0.1-GGUF',
-        
-        # CodeLlama models
-        'codellama': 'TheBloke/CodeLlama-7B-Instruct-GGUF',
-        'code-llama': 'TheBloke/CodeLlama-7B-Instruct-GGUF',
-    }
+    return MODEL_REPO_MAPPING
 
 def determine_model_repo(model_name):
     """Determine the correct HuggingFace repo path from user's model choice"""
     
     if not model_name or model_name == 'Unknown-Model':
         log("⚠️  No model specified, using default Phi-2", "WARN")
-        return 'TheBloke/phi-2-dpo-GGUF'
+        return DEFAULT_MODEL_REPO
     
-    # Get mapping
-    repo_mapping = get_model_repo_mapping()
     model_lower = model_name.lower().strip()
     
     # Direct mapping lookup
-    if model_lower in repo_mapping:
-        repo_path = repo_mapping[model_lower]
+    repo_path = MODEL_REPO_MAPPING.get(model_lower)
+    if repo_path:
         log(f"✅ Direct mapping: {model_name} -> {repo_path}")
         return repo_path
     
+    # An explicit GGUF repo is used as-is - checked before fuzzy matching so
+    # e.g. a specific Mistral GGUF repo is not remapped to v0.1
+    if '/' in model_lower and model_lower.endswith(('-gguf', '_gguf')):
+        log(f"✅ Using provided GGUF repo: {model_name}")
+        return model_name
+    
     # Fuzzy matching for common patterns
-    for key, repo_path in repo_mapping.items():
+    for key, repo_path in MODEL_REPO_MAPPING.items():
         if key in model_lower or model_lower in key:
             log(f"✅ Pattern match: {model_name} -> {repo_path}")
             return repo_path
@@ -71,27 +81,32 @@ def determine_model_repo(model_name):
     
     # Default fallback
     log(f"⚠️  Unknown model '{model_name}', using default Phi-2", "WARN")
-    return 'TheBloke/phi-2-dpo-GGUF'
+    return DEFAULT_MODEL_REPO
+
+# Max tokens per model family, checked in order against the lowercased repo path:
+# (family markers, required variant markers or None, max tokens)
+MODEL_MAX_TOKENS = (
+    (('tinyllama', '1.1b'), None, '2048'),
+    (('phi-2', 'phi2'), None, '2048'),
+    (('deepseek',), ('1.3b', 'coder'), '4096'),
+    (('llama-2-7b', 'llama2'), None, '4096'),
+    (('mistral',), None, '4096'),
+    (('codellama',), None, '4096'),
+)
+DEFAULT_MAX_TOKENS = '2048'  # Safe default
 
 def get_max_tokens_for_model(repo_path):
     """Get appropriate max tokens based on model type"""
     
     repo_lower = repo_path.lower()
     
-    if 'tinyllama' in repo_lower or '1.1b' in repo_lower:
-        return '2048'
-    elif 'phi-2' in repo_lower or 'phi2' in repo_lower:
-        return '2048'  
-    elif 'deepseek' in repo_lower and ('1.3b' in repo_lower or 'coder' in repo_lower):
-        return '4096'
-    elif 'llama-2-7b' in repo_lower or 'llama2' in repo_lower:
-        return '4096'
-    elif 'mistral' in repo_lower:
-        return '4096'
-    elif 'codellama' in repo_lower:
-        return '4096'
-    else:
-        return '2048'  # Safe default
+    # First matching row wins; the generator stops scanning at that row
+    return next(
+        (max_tokens for markers, variants, max_tokens in MODEL_MAX_TOKENS
+         if any(marker in repo_lower for marker in markers)
+         and (variants is None or any(variant in repo_lower for variant in variants))),
+        DEFAULT_MAX_TOKENS
+    )
 
 def setup_models(install_path, config):
     """
@@ -108,7 +123,7 @@ def setup_models(install_path, config):
         log("🤖 Setting up model configuration (Simplified Approach)...")
         
         # Get user's model choice
-        model_name = config.get('MODEL_NAME', config.get('DEFAULT_MODEL', 'phi-2'))
+        model_name = config.get('MODEL_NAME') or config.get('DEFAULT_MODEL') or 'phi-2'
         log(f"📝 User requested model: {model_name}")
         
         # Create models directory for Docker volume mapping
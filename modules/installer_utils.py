@@ -13,43 +13,88 @@ import sys
 import subprocess
 import secrets
 import socket
-import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
+# Pending log lines while inside log_batch(), otherwise None
+_log_buffer = None
+# Set once check_prerequisites() has passed; tool versions cannot change mid-run
+_prerequisites_ok = False
+
 def log(message, level="INFO"):
     """Enhanced logging with timestamps"""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    print("[" + timestamp + "] " + level + ": " + str(message))
+    line = "[" + timestamp + "] " + level + ": " + str(message)
+    if _log_buffer is not None:
+        _log_buffer.append(line)
+    else:
+        print(line)
 
-def run_command(command, cwd=None, timeout=300):
-    """Execute a shell command with proper error handling"""
+@contextmanager
+def log_batch():
+    """Buffer log() lines and write them to stdout in one call on exit"""
+    global _log_buffer
+    if _log_buffer is not None:
+        # Nested batch - the outermost one flushes
+        yield
+        return
+    
+    _log_buffer = []
+    try:
+        yield
+    finally:
+        lines, _log_buffer = _log_buffer, None
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+def start_command(command, cwd=None):
+    """Launch a shell command without waiting for it; pair with finish_command()"""
     try:
         log("Running: " + command)
-        result = subprocess.run(
-            command.split(), 
-            cwd=cwd, 
-            capture_output=True, 
-            text=True, 
-            timeout=timeout
+        return subprocess.Popen(
+            command.split(),
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
         )
-        
-        if result.stdout.strip():
-            log("Output: " + result.stdout.strip())
-        
-        if result.returncode == 0:
-            return True
-        else:
-            log("Command failed with return code " + str(result.returncode), "ERROR")
-            if result.stderr:
-                log("Error: " + result.stderr, "ERROR")
-            return False
-            
+    except Exception as e:
+        log("Error executing command: " + str(e), "ERROR")
+        return None
+
+def finish_command(process, timeout=300):
+    """Wait for a command from start_command() and report its outcome"""
+    if process is None:
+        return False
+    
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
         log("Command timed out after " + str(timeout) + " seconds", "ERROR")
         return False
     except Exception as e:
         log("Error executing command: " + str(e), "ERROR")
         return False
+    
+    if stdout.strip():
+        log("Output: " + stdout.strip())
+    
+    if process.returncode == 0:
+        return True
+    else:
+        log("Command failed with return code " + str(process.returncode), "ERROR")
+        if stderr:
+            log("Error: " + stderr, "ERROR")
+        return False
+
+def run_command(command, cwd=None, timeout=300):
+    """Execute a shell command with proper error handling"""
+    return finish_command(start_command(command, cwd), timeout)
 
 def generate_secure_api_key():
     """Generate a secure API key for AGiXT"""
@@ -57,6 +102,11 @@ def generate_secure_api_key():
 
 def check_prerequisites():
     """Check if all required tools are installed"""
+    global _prerequisites_ok
+    if _prerequisites_ok:
+        log("Prerequisites already verified ✓", "SUCCESS")
+        return True
+    
     tools = {
         'git': 'git --version',
         'docker': 'docker --version', 
@@ -64,14 +114,19 @@ def check_prerequisites():
     }
     
     log("Checking prerequisites...")
-    for tool, command in tools.items():
-        if run_command(command):
+    # Launch every check before waiting on any, so they run concurrently
+    processes = [(tool, start_command(command)) for tool, command in tools.items()]
+    
+    all_found = True
+    for tool, process in processes:
+        if finish_command(process):
             log(tool.title() + " ✓", "SUCCESS")
         else:
             log(tool.title() + " not found or not working", "ERROR")
-            return False
+            all_found = False
     
-    return True
+    _prerequisites_ok = all_found
+    return all_found
 
 def check_docker_network():
     """Check if agixt-network exists, create if not"""
@@ -147,6 +202,12 @@ def clone_agixt_repository(install_path, github_token=None):
         log("Error cloning repository: " + str(e), "ERROR")
         return False
 
+def check_port(port, timeout=5):
+    """Return the connect_ex() code for localhost:port (0 when it accepts)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex(('localhost', port))
+
 def test_endpoints(install_path, config):
     """Test if all endpoints are accessible"""
     log("Testing API endpoints...")
@@ -158,16 +219,16 @@ def test_endpoints(install_path, config):
         'EzLocalAI UI': 8502
     }
     
-    for name, port in endpoints.items():
+    # Probe concurrently
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        probes = [(name, port, executor.submit(check_port, port)) for name, port in endpoints.items()]
+    
+    for name, port, probe in probes:
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(('localhost', port))
-            if result == 0:
+            if probe.result() == 0:
                 log(name + " (port " + str(port) + ") is accessible", "SUCCESS")
             else:
                 log(name + " (port " + str(port) + ") is not accessible yet", "WARN")
-            sock.close()
         except Exception as e:
             log(name + " test failed: " + str(e), "WARN")
 
@@ -200,7 +261,6 @@ def install_graphql_dependencies(install_path):
         log("Installing GraphQL dependencies...")
         
         # Wait for container to be ready
-        import time
         time.sleep(30)
         
         # Install strawberry-graphql
@@ -230,6 +290,8 @@ def test_module():
     
     # Test logging
     log("Testing log function", "SUCCESS")
+    with log_batch():
+        log("Testing batched log function", "SUCCESS")
     
     # Test API key generation
     api_key = generate_secure_api_key()
@@ -24,7 +24,7 @@ import subprocess
 import urllib.request
 import urllib.error
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 def log(message, level="INFO"):
@@ -118,6 +118,16 @@ def check_file_structure(install_path):
         log(f"❌ File structure check failed: {e}", "ERROR")
         return False
 
+def fetch_status(url):
+    """Return the HTTP status code for url; HTTP errors are returned, not raised"""
+    req = urllib.request.Request(url)
+    req.add_header('User-Agent', 'AGiXT-Test/1.7.2')
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.getcode()
+    except urllib.error.HTTPError as e:
+        return e.code
+
 def test_basic_connectivity(install_path):
     """Test basic HTTP connectivity without API calls"""
     try:
@@ -133,29 +143,27 @@ def test_basic_connectivity(install_path):
         
         working_endpoints = 0
         
-        for url, name in endpoints:
+        log(f"🧪 Testing {', '.join(name for _, name in endpoints)}...")
+        
+        # Probe concurrently
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            probes = [executor.submit(fetch_status, url) for url, _ in endpoints]
+        
+        for (url, name), probe in zip(endpoints, probes):
             try:
-                log(f"🧪 Testing {name}...")
-                
-                req = urllib.request.Request(url)
-                req.add_header('User-Agent', 'AGiXT-Test/1.7.2')
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    status_code = response.getcode()
-                    if status_code < 400:
-                        log(f"✅ {name}: HTTP {status_code}", "SUCCESS")
-                        working_endpoints += 1
-                    else:
-                        log(f"⚠️  {name}: HTTP {status_code}", "WARN")
-                        
-            except urllib.error.HTTPError as e:
-                if e.code < 500:  # Client errors are often OK (auth required, etc.)
-                    log(f"✅ {name}: HTTP {e.code} (service responding)", "SUCCESS")
-                    working_endpoints += 1
-                else:
-                    log(f"⚠️  {name}: HTTP {e.code}", "WARN")
+                status_code = probe.result()
             except Exception as e:
                 log(f"❌ {name}: {type(e).__name__}", "ERROR")
+                continue
+            
+            if status_code < 400:
+                log(f"✅ {name}: HTTP {status_code}", "SUCCESS")
+                working_endpoints += 1
+            elif status_code < 500:  # Client errors are often OK (auth required, etc.)
+                log(f"✅ {name}: HTTP {status_code} (service responding)", "SUCCESS")
+                working_endpoints += 1
+            else:
+                log(f"⚠️  {name}: HTTP {status_code}", "WARN")
         
         log(f"📊 Connectivity: {working_endpoints}/{len(endpoints)} endpoints responding")
         